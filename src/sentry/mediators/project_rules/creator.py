@@ -1,4 +1,4 @@
-from collections import Iterable
+from collections.abc import Iterable
 
 from sentry.mediators import Mediator, Param
 from sentry.models import Actor, Rule
@@ -26,18 +26,16 @@ class Creator(Mediator):
         return rule
 
     def _get_kwargs(self):
-        data = {
-            "filter_match": self.filter_match,
-            "action_match": self.action_match,
-            "actions": self.actions,
-            "conditions": self.conditions,
-            "frequency": self.frequency,
-        }
-        _kwargs = {
+        return {
             "label": self.name,
             "owner": Actor.objects.get(id=self.owner) if self.owner else None,
             "environment_id": self.environment or None,
             "project": self.project,
-            "data": data,
+            "data": {
+                "filter_match": self.filter_match,
+                "action_match": self.action_match,
+                "actions": self.actions,
+                "conditions": self.conditions,
+                "frequency": self.frequency,
+            },
         }
-        return _kwargs
@@ -503,8 +503,12 @@ def unmerge(*posargs, **kwargs):
     source_events = []
     destination_events = {}
 
+    # Only used for membership checks, `locked_primary_hashes` itself is passed
+    # on to the next task and needs to stay serializable.
+    locked_primary_hashes_set = frozenset(locked_primary_hashes)
+
     for event in events:
-        unmerge_key = args.replacement.get_unmerge_key(event, locked_primary_hashes)
+        unmerge_key = args.replacement.get_unmerge_key(event, locked_primary_hashes_set)
         if unmerge_key is not None:
             destination_events.setdefault(unmerge_key, []).append(event)
         else:
@@ -1,16 +1,21 @@
 import abc
 import dataclasses
 from dataclasses import dataclass
-from typing import Any, Collection, Mapping, Optional, Sequence, Tuple, Union
+from typing import Any, Collection, Dict, Mapping, Optional, Sequence, Tuple, Union
+
+from django.db import transaction
 
 from sentry import eventstream
 from sentry.eventstore.models import Event
 from sentry.models.grouphash import GroupHash
 from sentry.models.project import Project
 from sentry.utils.datastructures import BidirectionalMapping
+from sentry.utils.iterators import chunked
 
 _DEFAULT_UNMERGE_KEY = "default"
 
+_POSTGRES_UPDATE_BATCH_SIZE = 1000
+
 # Weird type, but zero runtime cost in casting it to `Destinations`!
 InitialDestinations = Mapping[str, Tuple[int, None]]
 
@@ -96,7 +101,10 @@ class PrimaryHashUnmergeReplacement(UnmergeReplacement):
         self, event: Event, locked_primary_hashes: Collection[str]
     ) -> Optional[str]:
         primary_hash = event.get_primary_hash()
-        if primary_hash in self.fingerprints and primary_hash in locked_primary_hashes:
+        # `locked_primary_hashes` is a set in the unmerge task, check it first
+        # so that the linear scan over `fingerprints` is only hit for events
+        # that are actually about to be moved.
+        if primary_hash in locked_primary_hashes and primary_hash in self.fingerprints:
             return _DEFAULT_UNMERGE_KEY
 
         return None
@@ -116,10 +124,13 @@ class PrimaryHashUnmergeReplacement(UnmergeReplacement):
     def run_postgres_replacement(
         self, project: Project, destination_id: int, locked_primary_hashes: Collection[str]
     ) -> None:
-        # Move the group hashes to the destination.
-        GroupHash.objects.filter(project_id=project.id, hash__in=locked_primary_hashes).update(
-            group=destination_id
-        )
+        # Move the group hashes to the destination. Chunked to keep the `IN`
+        # clause small when unmerging a large number of hashes.
+        with transaction.atomic():
+            for hashes in chunked(locked_primary_hashes, _POSTGRES_UPDATE_BATCH_SIZE):
+                GroupHash.objects.filter(project_id=project.id, hash__in=hashes).update(
+                    group=destination_id
+                )
 
     def get_activity_args(self) -> Mapping[str, Any]:
         return {"fingerprints": self.fingerprints}
@@ -201,13 +212,20 @@ class UnmergeArgsBase(abc.ABC):
             )
 
     def dump_arguments(self) -> Mapping[str, Any]:
-        rv = dataclasses.asdict(self)
+        # Shallow copies only, `dataclasses.asdict` would recursively deep-copy
+        # `destinations` and `locked_primary_hashes` for no reason.
+        rv = _shallow_asdict(self)
         rv["fingerprints"] = None
         rv["destination_id"] = None
+        rv["replacement"] = _shallow_asdict(self.replacement)
         rv["replacement"]["type"] = _REPLACEMENT_TYPE_LABELS[type(self.replacement)]
         return rv
 
 
+def _shallow_asdict(obj: Any) -> Dict[str, Any]:
+    return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+
+
 @dataclass(frozen=True)
 class InitialUnmergeArgs(UnmergeArgsBase):
     # In tests the destination task is passed in explicitly from the outside,